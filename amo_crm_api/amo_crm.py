@@ -1,12 +1,30 @@
-from functools import cached_property
-from typing import Any, Dict, Generic, Iterable, List, Optional, Type, TypeVar, get_args
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    get_args,
+    get_origin,
+)
 
 from pydantic import TypeAdapter
+from requests import Response
 
 from .auth import BaseAuth
+from .exceptions import BatchError
 from .filters import Filter
 from .schemas import (
     ComplexCreateResponseSchema,
+    CreateResponseSchema,
     ContactSchema,
     CustomFieldSchema,
     LeadSchema,
@@ -19,12 +37,184 @@ from .schemas import (
     LeadLossReasonSchema,
     TagSchema,
 )
+from .schemas.common import EMBEDDED_OBJECTS_KEYS
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover
+    msgspec = None  # type: ignore[assignment]
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
 
 LeadType = TypeVar("LeadType", bound=LeadSchema)
 ContactType = TypeVar("ContactType", bound=ContactSchema)
 
+_COMPLEX_CREATE_LIST_ADAPTER = TypeAdapter(List[ComplexCreateResponseSchema])
+_ORJSON_MIN_SIZE = 8192
+_BATCH_SIZE = 50
+_READ_CHUNK_SIZE = 64 * 1024
+
+_LEAD_PATH = "/leads/%s"
+_LEAD_LINKS_PATH = "/leads/%s/links"
+_CONTACT_PATH = "/contacts/%s"
+_CONTACT_LINKS_PATH = "/contacts/%s/links"
+_PIPELINE_PATH = "/leads/pipelines/%s"
+_PIPELINE_STATUSES_PATH = "/leads/pipelines/%s/statuses"
+_PIPELINE_STATUS_PATH = "/leads/pipelines/%s/statuses/%s"
+_CUSTOM_FIELD_PATH = "/leads/custom_fields/%s"
+_USER_PATH = "/users/%s"
+_LOSS_REASON_PATH = "/leads/loss_reasons/%s"
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(object_type: type) -> Type[ListModelSchema]:
+    return ListModelSchema[object_type]  # type: ignore
+
+
+def _read_content(response: Response) -> bytearray:
+    # Growing one buffer avoids the chunk list that Response.content joins,
+    # roughly halving peak memory per page. iter_content keeps the requests
+    # exception types and hands the connection back to the pool when done.
+    content = bytearray()
+    for chunk in response.iter_content(chunk_size=_READ_CHUNK_SIZE):
+        content += chunk
+    return content
+
+
+@lru_cache(maxsize=None)
+def _items_adapter(object_type: type) -> TypeAdapter:
+    return TypeAdapter(List[object_type])  # type: ignore
+
+
+if msgspec is not None:
+
+    class _Envelope(msgspec.Struct):
+        embedded: Dict[str, Any] = msgspec.field(name="_embedded")
+        links: Optional[Dict[str, Any]] = msgspec.field(name="_links", default=None)
+
+    _ENVELOPE_DECODER = msgspec.json.Decoder(_Envelope)
+
+
+def _has_next_page(links: Optional[Dict[str, Any]]) -> bool:
+    # amoCRM only sends _links.next when another page exists. Without _links
+    # at all, keep requesting until the empty 204 page.
+    return links is None or "next" in links
+
+
+def _parse_page(object_type: type, content: bytes) -> Tuple[List[Any], bool]:
+    """Return the page items and whether another page follows"""
+    if msgspec is not None:
+        # Only the items go through pydantic, the envelope is never modelled.
+        # A malformed envelope falls through so pydantic raises its own error.
+        try:
+            envelope = _ENVELOPE_DECODER.decode(content)
+        except (msgspec.ValidationError, msgspec.DecodeError):
+            pass
+        else:
+            embedded = envelope.embedded
+            items: List[Any] = next(
+                (embedded[key] for key in EMBEDDED_OBJECTS_KEYS if key in embedded),
+                [],
+            )
+            return (
+                _items_adapter(object_type).validate_python(items),
+                _has_next_page(envelope.links),
+            )
+
+    model = _list_adapter(object_type)
+    # orjson only pays off once the JSON parser dominates validation time.
+    if orjson is not None and len(content) > _ORJSON_MIN_SIZE:
+        page = model.model_validate(orjson.loads(content))
+    else:
+        page = model.model_validate_json(content)
+    return page.embedded.objects, _has_next_page(page.links)
+
+
+_LINK_LIST = _list_adapter(LinkSchema)
+_PIPELINE_LIST = _list_adapter(PipelineSchema)
+_STATUS_LIST = _list_adapter(StatusSchema)
+_LOSS_REASON_LIST = _list_adapter(LeadLossReasonSchema)
+
+
+class _cached_attr:
+    """Lock-free replacement for ``functools.cached_property``.
+
+    The computed value is stored in the instance ``__dict__``, which shadows
+    this non-data descriptor on every subsequent access.
+    """
+
+    def __init__(self, func) -> None:
+        self.func = func
+        self.name = func.__name__
+
+    def __set_name__(self, owner, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = self.func(instance)
+        instance.__dict__[self.name] = value
+        return value
+
+
+def _find_model(args: Tuple[Any, ...], base_type: type) -> Any:
+    for arg in args:
+        if isinstance(arg, type) and issubclass(arg, base_type):
+            return arg
+    return None
+
+
+def _check_model(arg: Any, base_type: type) -> Optional[type]:
+    if not isinstance(arg, type):
+        return None
+    if not issubclass(arg, base_type):
+        raise TypeError(f"{arg.__name__} is not a subclass of {base_type.__name__}")
+    return arg
+
+
+def _alias_models(alias: Any) -> Tuple[Any, Any]:
+    """Concrete lead and contact models bound by one parametrized alias"""
+    args = get_args(alias)
+    if get_origin(alias) is not AmoCRMApi:
+        # Generic subclasses may bind the models in any order.
+        return _find_model(args, LeadSchema), _find_model(args, ContactSchema)
+
+    lead_model, contact_model = args
+    return (
+        _check_model(lead_model, LeadSchema),
+        _check_model(contact_model, ContactSchema),
+    )
+
+
+@lru_cache(maxsize=None)
+def _resolve_models(sources: Tuple[Any, ...]) -> Tuple[Any, Any]:
+    # Cached per parametrization, so instances of the same AmoCRMApi[L, C]
+    # share one lookup. Earlier sources take precedence.
+    lead_model = contact_model = None
+    for source in sources:
+        for arg in get_args(source):
+            if not isinstance(arg, (type, TypeVar)):
+                raise TypeError(
+                    f"Cannot resolve a model from {arg!r}, pass the class itself"
+                )
+        lead, contact = _alias_models(source)
+        lead_model = lead_model or lead
+        contact_model = contact_model or contact
+    return lead_model or LeadSchema, contact_model or ContactSchema
+
 
 class AmoCRMApi(Generic[LeadType, ContactType]):
+    def __class_getitem__(cls, params):
+        alias = super().__class_getitem__(params)  # type: ignore
+        # Forward references are only rejected once an instance needs its
+        # models, so they stay usable in annotations.
+        _alias_models(alias)
+        return alias
+
     def __init__(self, auth: BaseAuth) -> None:
         self._auth = auth
         self.request = self._auth.request
@@ -33,7 +223,7 @@ class AmoCRMApi(Generic[LeadType, ContactType]):
     def get_lead(self, lead_id: int) -> LeadType:
         response = self.request(
             method="GET",
-            path=f"/leads/{lead_id}",
+            path=_LEAD_PATH % lead_id,
             params={"with": "contacts,loss_reason"},
         )
         return self._lead_model.model_validate_json(json_data=response.content)
@@ -41,20 +231,17 @@ class AmoCRMApi(Generic[LeadType, ContactType]):
     def get_lead_links(self, lead_id: int) -> List[LinkSchema]:
         response = self.request(
             method="GET",
-            path=f"/leads/{lead_id}/links",
-        )
-        return (
-            ListModelSchema[LinkSchema]
-            .model_validate_json(response.content)
-            .embedded.objects
+            path=_LEAD_LINKS_PATH % lead_id,
         )
+        return _LINK_LIST.model_validate_json(response.content).embedded.objects
 
     def get_lead_list(
-        self, filters: List[Filter] = [], limit: int = 50
+        self, filters: Optional[List[Filter]] = None, limit: int = 50
     ) -> Iterable[LeadType]:
         model = self._lead_model
         params = {"with": "contacts,loss_reason", "limit": limit, "page": 1}
-        params.update(self._filters_to_params(filters))
+        if filters:
+            params.update(self._filters_to_params(filters))
         return self._objects_list_generator(
             object_type=model, path="/leads", params=params
         )
@@ -65,6 +252,14 @@ class AmoCRMApi(Generic[LeadType, ContactType]):
         )
         return response.content
 
+    def create_leads(self, leads: List[LeadType]) -> List[CreateResponseSchema]:
+        return self._batch_request(
+            method="POST",
+            path="/leads",
+            payload=(lead.model_dump(exclude_unset=True) for lead in leads),
+            response_model=CreateResponseSchema,
+        )
+
     def create_complex_lead(
         self, lead: LeadType, contact: ContactType
     ) -> ComplexCreateResponseSchema:
@@ -74,42 +269,43 @@ class AmoCRMApi(Generic[LeadType, ContactType]):
         lead_data["_embedded"]["contacts"] = [contact_data]
         response = self.request(method="POST", path="/leads/complex", json=[lead_data])
 
-        return TypeAdapter(List[ComplexCreateResponseSchema]).validate_json(
-            response.content
-        )[0]
+        return _COMPLEX_CREATE_LIST_ADAPTER.validate_json(response.content)[0]
 
     def update_lead(self, lead: LeadType) -> UpdateResponseSchema:
-        lead_id = lead.id
-        response = self.request(
+        return self.update_leads([lead])[0]
+
+    def update_leads(self, leads: List[LeadType]) -> List[UpdateResponseSchema]:
+        leads = list(leads)
+        self._check_ids(leads)
+        return self._batch_request(
             method="PATCH",
-            path=f"/leads/{lead_id}",
-            json=lead.model_dump(exclude_unset=True, by_alias=True),
+            path="/leads",
+            payload=(
+                lead.model_dump(exclude_unset=True, by_alias=True) for lead in leads
+            ),
+            response_model=UpdateResponseSchema,
         )
-        return UpdateResponseSchema.model_validate_json(json_data=response.content)
 
     def get_contact(self, contact_id: int) -> ContactType:
         response = self.request(
-            method="GET", path=f"/contacts/{contact_id}", params={"with": "leads"}
+            method="GET", path=_CONTACT_PATH % contact_id, params={"with": "leads"}
         )
         return self._contact_model.model_validate_json(json_data=response.content)
 
     def get_contact_links(self, contact_id: int) -> List[LinkSchema]:
         response = self.request(
             method="GET",
-            path=f"/contacts/{contact_id}/links",
-        )
-        return (
-            ListModelSchema[LinkSchema]
-            .model_validate_json(response.content)
-            .embedded.objects
+            path=_CONTACT_LINKS_PATH % contact_id,
         )
+        return _LINK_LIST.model_validate_json(response.content).embedded.objects
 
     def get_contact_list(
-        self, filters: List[Filter] = [], limit: int = 50
+        self, filters: Optional[List[Filter]] = None, limit: int = 50
     ) -> Iterable[ContactType]:
         model = self._contact_model
         params = {"with": "leads", "limit": limit, "page": 1}
-        params.update(self._filters_to_params(filters))
+        if filters:
+            params.update(self._filters_to_params(filters))
         return self._objects_list_generator(
             object_type=model, path="/contacts", params=params
         )
@@ -122,45 +318,58 @@ class AmoCRMApi(Generic[LeadType, ContactType]):
         )
         return response.content
 
+    def create_contacts(
+        self, contacts: List[ContactType]
+    ) -> List[CreateResponseSchema]:
+        return self._batch_request(
+            method="POST",
+            path="/contacts",
+            payload=(contact.model_dump(exclude_unset=True) for contact in contacts),
+            response_model=CreateResponseSchema,
+        )
+
     def update_contact(self, contact: ContactType) -> UpdateResponseSchema:
-        contact_id = contact.id
-        response = self.request(
+        return self.update_contacts([contact])[0]
+
+    def update_contacts(
+        self, contacts: List[ContactType]
+    ) -> List[UpdateResponseSchema]:
+        contacts = list(contacts)
+        self._check_ids(contacts)
+        return self._batch_request(
             method="PATCH",
-            path=f"/contacts/{contact_id}",
-            json=contact.model_dump(exclude_unset=True, by_alias=True),
+            path="/contacts",
+            payload=(
+                contact.model_dump(exclude_unset=True, by_alias=True)
+                for contact in contacts
+            ),
+            response_model=UpdateResponseSchema,
         )
-        return UpdateResponseSchema.model_validate_json(json_data=response.content)
 
     def get_pipeline(self, pipeline_id: int) -> PipelineSchema:
-        response = self.request(method="GET", path=f"/leads/pipelines/{pipeline_id}")
+        response = self.request(method="GET", path=_PIPELINE_PATH % pipeline_id)
         return PipelineSchema.model_validate_json(response.content)
 
     def get_pipeline_list(self) -> List[PipelineSchema]:
         response = self.request(method="GET", path="/leads/pipelines")
-        return (
-            ListModelSchema[PipelineSchema]
-            .model_validate_json(json_data=response.content)
-            .embedded.objects
-        )
+        return _PIPELINE_LIST.model_validate_json(
+            json_data=response.content
+        ).embedded.objects
 
     def get_pipeline_status(self, pipeline_id: int, status_id: int) -> StatusSchema:
         response = self.request(
-            method="GET", path=f"/leads/pipelines/{pipeline_id}/statuses/{status_id}"
+            method="GET", path=_PIPELINE_STATUS_PATH % (pipeline_id, status_id)
         )
         return StatusSchema.model_validate_json(response.content)
 
     def get_pipeline_status_list(self, pipeline_id: int) -> List[StatusSchema]:
         response = self.request(
-            method="GET", path=f"/leads/pipelines/{pipeline_id}/statuses"
-        )
-        return (
-            ListModelSchema[StatusSchema]
-            .model_validate_json(response.content)
-            .embedded.objects
+            method="GET", path=_PIPELINE_STATUSES_PATH % pipeline_id
         )
+        return _STATUS_LIST.model_validate_json(response.content).embedded.objects
 
     def get_custom_field(self, field_id: int) -> CustomFieldSchema:
-        response = self.request(method="GET", path=f"/leads/custom_fields/{field_id}")
+        response = self.request(method="GET", path=_CUSTOM_FIELD_PATH % field_id)
         return CustomFieldSchema.model_validate_json(response.content)
 
     def get_custom_field_list(self) -> Iterable[CustomFieldSchema]:
@@ -170,7 +379,7 @@ class AmoCRMApi(Generic[LeadType, ContactType]):
         )
 
     def get_user(self, user_id: int) -> UserSchema:
-        response = self.request(method="GET", path=f"/users/{user_id}")
+        response = self.request(method="GET", path=_USER_PATH % user_id)
         return UserSchema.model_validate_json(response.content)
 
     def get_users(self) -> Iterable[UserSchema]:
@@ -178,45 +387,82 @@ class AmoCRMApi(Generic[LeadType, ContactType]):
 
     def get_loss_reason(self, loss_reason_id: int) -> LeadLossReasonSchema:
         response = self.request(
-            method="GET", path=f"/leads/loss_reasons/{loss_reason_id}"
+            method="GET", path=_LOSS_REASON_PATH % loss_reason_id
         )
         return LeadLossReasonSchema.model_validate_json(response.content)
 
     def get_loss_reason_list(self) -> List[LeadLossReasonSchema]:
         response = self.request(method="GET", path="/leads/loss_reasons")
-        return (
-            ListModelSchema[LeadLossReasonSchema]
-            .model_validate_json(response.content)
-            .embedded.objects
-        )
+        return _LOSS_REASON_LIST.model_validate_json(response.content).embedded.objects
 
     def get_lead_tags(self) -> Iterable[TagSchema]:
         return self._objects_list_generator(object_type=TagSchema, path="/leads/tags")
 
+    def _batch_request(
+        self,
+        method: Literal["POST", "PATCH"],
+        path: str,
+        payload: Iterable[dict],
+        response_model: type,
+    ) -> List[Any]:
+        """Send ``payload`` in chunks of ``_BATCH_SIZE``.
+
+        If a chunk fails, ``BatchError`` is raised from the original error
+        with the results of the chunks already written as ``objects``.
+        """
+        objects: List[Any] = []
+        payload = iter(payload)
+        try:
+            while chunk := list(islice(payload, _BATCH_SIZE)):
+                response = self.request(method=method, path=path, json=chunk)
+                objects.extend(
+                    _list_adapter(response_model)
+                    .model_validate_json(response.content)
+                    .embedded.objects
+                )
+        except Exception as error:
+            raise BatchError(objects) from error
+        return objects
+
+    @staticmethod
+    def _check_ids(objects: Iterable[Any]) -> None:
+        # Batch updates go to the collection endpoint, which needs the id
+        # in every payload.
+        for obj in objects:
+            if obj.id is None:
+                raise ValueError(f"{type(obj).__name__} without id can't be updated")
+
     @staticmethod
     def _filters_to_params(filters: List[Filter]) -> Dict[str, Any]:
-        params = dict()
-        for filter_obj in filters:
-            params.update(filter_obj._as_params())
-        return params
-
-    @cached_property
-    def _lead_model(self) -> type[LeadType]:
-        args = get_args(self.__orig_class__)  # type: ignore
-        base_type: type[LeadType] = LeadSchema  # type: ignore
-        for arg in args:
-            if issubclass(arg, base_type):
-                return arg
-        return base_type
-
-    @cached_property
+        if not filters:
+            return {}
+        return {
+            key: value
+            for filter_obj in filters
+            for key, value in filter_obj._as_params().items()
+        }
+
+    @_cached_attr
+    def _lead_model(self) -> Type[LeadType]:
+        return _resolve_models(self._model_sources())[0]
+
+    @_cached_attr
     def _contact_model(self) -> Type[ContactType]:
-        args = get_args(self.__orig_class__)  # type: ignore
-        base_type: Type[ContactType] = ContactSchema  # type: ignore
-        for arg in args:
-            if issubclass(arg, base_type):
-                return arg
-        return base_type
+        return _resolve_models(self._model_sources())[1]
+
+    def _model_sources(self) -> Tuple[Any, ...]:
+        # The instance's own parametrization first, then the parametrized
+        # AmoCRMApi bases of its class, e.g. ``class Api(AmoCRMApi[L, C])``.
+        sources = []
+        orig_class = getattr(self, "__orig_class__", None)
+        if orig_class is not None:
+            sources.append(orig_class)
+        for klass in type(self).__mro__:
+            for base in klass.__dict__.get("__orig_bases__", ()):
+                origin = get_origin(base)
+                if isinstance(origin, type) and issubclass(origin, AmoCRMApi):
+                    sources.append(base)
+        return tuple(sources)
 
     def _objects_list_generator(
         self, object_type: type, path: str, params: Optional[dict] = None, limit=250
@@ -225,18 +471,36 @@ class AmoCRMApi(Generic[LeadType, ContactType]):
         params["limit"] = params.get("limit", limit)
         params["page"] = params.get("page", 1)
 
-        while True:
-            response = self.request(method="GET", path=path, params=params)
-            
-            if response.status_code != 200:
-                break
-            item_list = (
-                ListModelSchema[object_type]  # type: ignore
-                .model_validate_json(response.content)
-                .embedded.objects
+        def fetch(page: int) -> Optional[bytearray]:
+            response = self.request(
+                method="GET", path=path, params={**params, "page": page}, stream=True
             )
-
-            for item in item_list:
-                yield item
-
-            params["page"] += 1
+            content = _read_content(response)
+            return content if response.status_code == 200 else None
+
+        page = params["page"]
+        # Pages are fetched on a single worker so the next request is already
+        # in flight while the current one is consumed. No request is issued
+        # after a page without a next link.
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            future = executor.submit(fetch, page)
+            while True:
+                content = future.result()
+
+                if content is None:
+                    break
+
+                item_list, has_next = _parse_page(object_type, content)
+
+                if not has_next:
+                    yield from item_list
+                    return
+
+                page += 1
+                future = executor.submit(fetch, page)
+
+                yield from item_list
+        finally:
+            # Closing the generator early must not wait for the prefetch.
+            executor.shutdown(wait=False, cancel_futures=True)
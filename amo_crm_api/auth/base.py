@@ -1,8 +1,10 @@
 from abc import ABC, abstractmethod
+from threading import RLock
 from time import sleep
 from typing import Literal, Optional, Union
 
-from requests import Response, models, request, exceptions
+from requests import Response, Session, models, exceptions
+from requests.adapters import HTTPAdapter
 
 from ..exceptions import (
     DoesNotExist,
@@ -18,6 +20,11 @@ class BaseAuth(ABC):
         self._subdomain = subdomain
         self._api_v = "/api/v4"
         self._url = f"https://{self._subdomain}.amocrm.ru"
+        self._lock = RLock()
+        self._session = Session()
+        self._session.mount(
+            "https://", HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        )
 
     def request(
         self,
@@ -27,48 +34,59 @@ class BaseAuth(ABC):
         params: Optional[dict] = None,
         data: Optional[dict] = None,
         json: Optional[Union[dict, list]] = None,
+        stream: bool = False,
         tried: int = 0,
     ) -> Response:
         request_url = url + path if url else self._url + self._api_v + path
-        sleep(0.1)
-        try:
-            response = request(
-                method=method,
-                url=request_url,
-                params=params,
-                data=data,
-                json=json,
-                auth=self._auth,
-                timeout=5,
-            )
-        except exceptions.ReadTimeout:
-            if tried <= 5:
-                return self.request(
+        # List generators fetch pages on a worker thread; the lock keeps the
+        # throttle and token refresh serialized across threads.
+        with self._lock:
+            sleep(0.1)
+            try:
+                response = self._session.request(
                     method=method,
-                    path=path,
-                    url=url,
+                    url=request_url,
                     params=params,
                     data=data,
                     json=json,
-                    tried=tried + 1,
+                    auth=self._auth,
+                    timeout=5,
+                    stream=stream,
                 )
-            else:
-                raise exceptions.ReadTimeout()
+            except exceptions.ReadTimeout:
+                if tried <= 5:
+                    return self.request(
+                        method=method,
+                        path=path,
+                        url=url,
+                        params=params,
+                        data=data,
+                        json=json,
+                        stream=stream,
+                        tried=tried + 1,
+                    )
+                else:
+                    raise exceptions.ReadTimeout()
 
-        if response.status_code == 404:
-            raise DoesNotExist()
+        # Streamed responses hold a pooled connection until closed.
+        try:
+            if response.status_code == 404:
+                raise DoesNotExist()
 
-        elif response.status_code == 401:
-            raise AuthenticationError()
+            elif response.status_code == 401:
+                raise AuthenticationError()
 
-        elif response.status_code == 400:
-            raise ValidationError(response.json())
+            elif response.status_code == 400:
+                raise ValidationError(response.json())
 
-        elif response.status_code == 403:
-            raise AccountBlockedError()
+            elif response.status_code == 403:
+                raise AccountBlockedError()
 
-        elif response.status_code == 429:
-            raise LimitExceededError()
+            elif response.status_code == 429:
+                raise LimitExceededError()
+        except Exception:
+            response.close()
+            raise
 
         return response
 
@@ -18,3 +18,9 @@ class LimitExceededError(Exception):
 
 class AccountBlockedError(Exception):
     pass
+
+
+class BatchError(Exception):
+    def __init__(self, objects: list) -> None:
+        self.objects = objects
+        super().__init__(objects)
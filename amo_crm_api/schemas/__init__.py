@@ -1,5 +1,6 @@
 from .common import (
     ComplexCreateResponseSchema,
+    CreateResponseSchema,
     CustomFieldsValueSchema,
     ListModelSchema,
     UpdateResponseSchema,
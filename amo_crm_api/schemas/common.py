@@ -56,31 +56,39 @@ class CustomFieldsValueSchema(BaseModel):
 
 K = TypeVar("K")
 
+EMBEDDED_OBJECTS_KEYS = (
+    "leads",
+    "contacts",
+    "pipelines",
+    "statuses",
+    "custom_fields",
+    "users",
+    "links",
+    "loss_reasons",
+    "tags",
+)
+
 
 class EmbeddedSchema(BaseModel, Generic[K]):
     objects: Annotated[
         List[K],
         Field(
-            validation_alias=AliasChoices(
-                "leads",
-                "contacts",
-                "pipelines",
-                "statuses",
-                "custom_fields",
-                "users",
-                "links",
-                "loss_reasons",
-                "tags"
-            )
+            validation_alias=AliasChoices(*EMBEDDED_OBJECTS_KEYS)
         ),
     ] = []
 
 
 class ListModelSchema(BaseModel, Generic[K]):
     page: Annotated[Optional[int], Field(alias="_page")] = None
+    links: Annotated[Optional[dict], Field(alias="_links")] = None
     embedded: Annotated[EmbeddedSchema[K], Field(alias="_embedded")]
 
 
+class CreateResponseSchema(BaseModel):
+    id: int
+    request_id: Optional[str] = None
+
+
 class UpdateResponseSchema(BaseModel):
     id: int
     updated_at: datetime
@@ -73,4 +73,5 @@ class ContactSchema(BaseModelForFieldsSchema):
         if self.embedded and self.embedded.leads:
             self.leads = self.embedded.leads
             self.tags = self.embedded.tags
-        super().model_post_init(__context)
+        if self.custom_fields_values:
+            super().model_post_init(__context)
@@ -79,4 +79,5 @@ class LeadSchema(BaseModelForFieldsSchema):
             self.contacts = self.embedded.contacts
             self.loss_reason = self.embedded.loss_reason
             self.tags = self.embedded.tags
-        super().model_post_init(__context)
+        if self.custom_fields_values:
+            super().model_post_init(__context)
@@ -2,9 +2,11 @@ from datetime import datetime, timedelta, timezone
 
 
 def set_tz(hours: int, minutes: int = 0):
+    delta = timedelta(hours=hours, minutes=minutes)
+    tz = timezone(offset=delta)
+
     def replace(t):
         if isinstance(t, datetime):
-            delta = timedelta(hours=hours, minutes=minutes)
-            return t.replace(tzinfo=timezone(offset=delta)) + delta
+            return t.replace(tzinfo=tz) + delta
         return t
     return replace
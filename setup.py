@@ -16,6 +16,10 @@ setup(
     url="https://github.com/damir-2000/amo_crm_api",
     packages=find_packages(),
     install_requires=requirements,
+    extras_require={
+        "orjson": ["orjson>=3.9.0"],
+        "msgspec": ["msgspec>=0.18.0"],
+    },
     license="MIT",
     python_requires=">=3.9.13",
     # classifiers=[